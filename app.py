@@ -1,6 +1,12 @@
 import dash
 from dash import dcc, html
 from dash.dependencies import Input, Output
+from flask_caching import Cache
+import pandas as pd
+
+# Copy-on-write lets the processing pipeline skip eager defensive copies
+pd.set_option("mode.copy_on_write", True)
+
 from data.fetch_data import fetch_player_data
 from data.process_data import calculate_average_points
 from visualization.plot_data import plot_average_points
@@ -8,6 +14,17 @@ from visualization.plot_data import plot_average_points
 # Initialize the Dash app
 app = dash.Dash(__name__)
 
+# Disk-backed cache so repeated player selections (and app restarts)
+# don't re-hit the NBA API; entries expire after a day
+cache = Cache(app.server, config={
+    'CACHE_TYPE': 'FileSystemCache',
+    'CACHE_DIR': '.cache'
+})
+
+@cache.memoize(timeout=86400)
+def get_player_data(player_id):
+    return fetch_player_data(player_id)
+
 # Define the layout
 app.layout = html.Div([
     html.H1('NBA Player Analysis'),
@@ -28,7 +45,7 @@ app.layout = html.Div([
     [Input('player-dropdown', 'value')]
 )
 def update_graph(player_id):
-    player_career_df = fetch_player_data(player_id)
+    player_career_df = get_player_data(player_id)
     average_points = calculate_average_points(player_career_df)
 
     fig = {
@@ -0,0 +1,33 @@
+# This module overlaps the independent network fetches for a player page
+# (career data and headshot) with asyncio instead of running them serially
+import asyncio
+from io import BytesIO
+
+import httpx
+import streamlit as st
+from PIL import Image
+
+from data.fetch_data import CACHE_TTL, fetch_longevity_data
+
+_LIMITS = httpx.Limits(max_connections=32)
+
+async def _fetch_image(client, url):
+    try:
+        response = await client.get(url, timeout=5)
+        return Image.open(BytesIO(response.content))
+    except Exception:
+        return None
+
+async def _gather_player_page(player_id, image_url):
+    # nba_api is sync-only, so its call runs on a worker thread while the
+    # headshot downloads on the event loop
+    async with httpx.AsyncClient(limits=_LIMITS) as client:
+        return await asyncio.gather(
+            asyncio.to_thread(fetch_longevity_data, player_id),
+            _fetch_image(client, image_url),
+        )
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def fetch_player_page(player_id, image_url):
+    longevity_data, image = asyncio.run(_gather_player_page(player_id, image_url))
+    return longevity_data, image
@@ -1,19 +1,132 @@
+import os
+import time
+import numpy as np
 import pandas as pd
-from nba_api.stats.endpoints import playercareerstats
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from nba_api.stats.endpoints import playercareerstats, commonplayerinfo, playerprofilev2, playerindex
+from nba_api.stats.library import http as nba_http
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from io import BytesIO
 from PIL import Image
 import streamlit as st
 
+# Shared pooled session so image downloads and nba_api calls reuse
+# TCP/TLS connections to cdn.nba.com / stats.nba.com instead of paying
+# a fresh handshake per request
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+nba_http.NBAStatsHTTP._session = _SESSION
+
+# Cache API responses on disk for a day so reruns (and server restarts)
+# don't re-hit stats.nba.com for data that only changes between games
+CACHE_TTL = 24 * 3600
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, persist="disk")
 def fetch_player_data(player_id):
     player_career = playercareerstats.PlayerCareerStats(player_id=player_id)
     player_career_df = player_career.get_data_frames()[0]
     return player_career_df
 
+_PLAYERS_PARQUET = os.path.join('.cache', 'players.parquet')
+
+# Everything the longevity view needs from one fetch; `career` carries
+# the merged per-season frame, so callers don't need fetch_player_data
+# for the same player on the same page
+LongevityData = namedtuple('LongevityData', ['career', 'bio', 'advanced'])
+
+# Columns the longevity pipeline actually consumes; everything else is
+# dropped at the fetch boundary so every groupby/rolling pass downstream
+# moves fewer bytes
+_CAREER_COLUMNS = ['PLAYER_ID', 'SEASON_ID', 'TEAM_ABBREVIATION', 'PLAYER_AGE', 'GP', 'MIN',
+                   'PTS', 'AST', 'REB', 'STL', 'BLK', 'FGA', 'FGM', 'FTA', 'FTM', 'TOV']
+_BIO_COLUMNS = ['PERSON_ID', 'DISPLAY_FIRST_LAST', 'POSITION', 'DRAFT_YEAR', 'HEIGHT', 'WEIGHT']
+_ADVANCED_COLUMNS = ['SEASON_ID', 'TEAM_ABBREVIATION', 'GS', 'FG_PCT', 'FG3_PCT', 'FT_PCT']
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, persist="disk")
+def fetch_all_players():
+    # A day-old roster is fine; the Parquet copy lets every worker (and
+    # a restarted server) skip the playerindex call entirely
+    if os.path.exists(_PLAYERS_PARQUET) and time.time() - os.path.getmtime(_PLAYERS_PARQUET) < CACHE_TTL:
+        return pd.read_parquet(_PLAYERS_PARQUET)
+
+    players_df = playerindex.PlayerIndex().get_data_frames()[0]
+    players_df = players_df.rename(columns={'PERSON_ID': 'PLAYER_ID'})
+    players_df['PLAYER_NAME'] = players_df['PLAYER_FIRST_NAME'] + ' ' + players_df['PLAYER_LAST_NAME']
+    players_df = players_df.sort_values('PLAYER_NAME', ignore_index=True)
+
+    os.makedirs('.cache', exist_ok=True)
+    players_df.to_parquet(_PLAYERS_PARQUET, compression='zstd')
+    return players_df
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, persist="disk")
+def fetch_longevity_data(player_id):
+    # The three endpoints are independent, so fetch them concurrently
+    # instead of stacking three network round-trips; the pooled session
+    # lets the connections share TLS state
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        career_future = executor.submit(
+            lambda: playercareerstats.PlayerCareerStats(player_id=player_id).get_data_frames()[0])
+        bio_future = executor.submit(
+            lambda: commonplayerinfo.CommonPlayerInfo(player_id=player_id).get_data_frames()[0])
+        advanced_future = executor.submit(
+            lambda: playerprofilev2.PlayerProfileV2(player_id=player_id)
+            .season_totals_regular_season.get_data_frame())
+        career_df = career_future.result()
+        bio_df = bio_future.result()
+        advanced_df = advanced_future.result()
+
+    career_df = career_df[[c for c in _CAREER_COLUMNS if c in career_df.columns]]
+    bio_df = bio_df[[c for c in _BIO_COLUMNS if c in bio_df.columns]]
+    advanced_df = advanced_df[[c for c in _ADVANCED_COLUMNS if c in advanced_df.columns]]
+
+    # Traded players get one row per team plus a TOT row, so SEASON_ID
+    # alone is not unique on either side; join on the (season, team)
+    # pair and let pandas verify the match really is 1:1
+    career_df = career_df.merge(advanced_df, on=['SEASON_ID', 'TEAM_ABBREVIATION'],
+                                how='left', suffixes=('', '_advanced'),
+                                sort=False, validate='one_to_one')
+
+    career_df['POSITION'] = bio_df['POSITION'].iloc[0]
+
+    # Normalize DRAFT_YEAR once at the fetch boundary ('Undrafted' and
+    # blanks fall back to the rookie season) so downstream code never
+    # re-coerces or re-fills it
+    draft_year = pd.to_numeric(bio_df['DRAFT_YEAR'].iloc[0], errors='coerce')
+    if pd.isna(draft_year):
+        draft_year = int(career_df['SEASON_ID'].min()[:4])
+    career_df['DRAFT_YEAR'] = np.int16(draft_year)
+
+    # Simplified per-48 efficiency rating, computed column-wise over the
+    # whole career in one shot instead of row by row
+    min_safe = career_df['MIN'].where(career_df['MIN'] > 0, 1)
+    positive = (career_df['PTS'] + 1.2 * career_df['REB'] + 1.5 * career_df['AST']
+                + 2.0 * career_df['STL'] + 2.0 * career_df['BLK'])
+    negative = ((career_df['FGA'] - career_df['FGM'])
+                + 0.5 * (career_df['FTA'] - career_df['FTM'])
+                + career_df['TOV'])
+    career_df['PLAYER_EFFICIENCY_RATING'] = (positive - negative) * (48.0 / min_safe) * (15.0 / 13.0)
+
+    # Stat ranges fit comfortably in float32/int16; halving the bytes per
+    # element halves the memory traffic of every downstream pass
+    # (PLAYER_ID stays untouched — it's a key, not a measure)
+    int_cols = career_df.select_dtypes('integer').columns.difference(['PLAYER_ID'])
+    float_cols = career_df.select_dtypes('floating').columns
+    career_df[int_cols] = career_df[int_cols].apply(pd.to_numeric, downcast='integer')
+    career_df[float_cols] = career_df[float_cols].apply(pd.to_numeric, downcast='float')
+
+    return LongevityData(career_df, bio_df, advanced_df)
+
 @st.cache_data
 def load_image(url):
     try:
-        response = requests.get(url, timeout=5)
+        response = _SESSION.get(url, timeout=5)
         img = Image.open(BytesIO(response.content))
         return img
     except:
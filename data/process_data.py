@@ -1,5 +1,16 @@
 # This module contains functions for processing NBA player data
+import numpy as np
 import pandas as pd
+import streamlit as st
+
+# Stats tracked with recency-weighted rolling averages in the longevity pipeline
+ROLLING_STATS = ['PTS', 'AST', 'REB', 'GP', 'MIN_PER_GAME', 'PLAYER_EFFICIENCY_RATING']
+_ROLLING_WEIGHTS = np.array([0.5, 0.3, 0.2])
+
+# Cheap DataFrame digest so st.cache_data can key on frame contents
+# without serializing the whole frame on every rerun
+_DF_HASH = {pd.DataFrame: lambda d: (len(d), tuple(d.columns),
+                                     int(pd.util.hash_pandas_object(d, index=True).sum()))}
 
 def calculate_average_points(player_career_df):
     if not isinstance(player_career_df, pd.DataFrame):
@@ -10,3 +21,86 @@ def calculate_average_points(player_career_df):
     
     average_points = player_career_df.groupby('SEASON_ID')['PTS'].mean()
     return average_points
+
+@st.cache_data(ttl=3600, show_spinner=False, hash_funcs=_DF_HASH)
+def process_longevity_features(career_df):
+    if not isinstance(career_df, pd.DataFrame):
+        raise ValueError("Input must be a pandas DataFrame")
+
+    # Shallow copy only: under the Copy-on-Write mode the apps enable at
+    # startup this duplicates no column data, but unlike a bare name
+    # binding it keeps the derived columns and dtype casts below from
+    # leaking into the caller's frame
+    df = career_df.copy(deep=False)
+
+    # Categorical keys let the groupbys hash small integer codes instead
+    # of Python strings (observed=True everywhere keeps unused category
+    # combinations from materializing)
+    for col in ('PLAYER_ID', 'POSITION', 'SEASON_ID'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    # Season labels come back as '2003-04'; keep the starting year
+    df['SEASON_YEAR'] = df['SEASON_ID'].str[:4].astype(int)
+    df['CAREER_YEAR'] = df['SEASON_YEAR'] - df['SEASON_YEAR'].min() + 1
+    # DRAFT_YEAR arrives already normalized to an int by the fetch layer
+    df['YEARS_FROM_DRAFT'] = df['SEASON_YEAR'] - df['DRAFT_YEAR']
+
+    # Per-game workload; floor GP at 1 with one vectorized op so
+    # zero-game seasons don't divide by zero
+    df['MIN_PER_GAME'] = df['MIN'].to_numpy() / np.maximum(df['GP'].to_numpy(), 1)
+    df['GP_RATIO'] = np.minimum(df['GP'].to_numpy() / 82.0, 1.0)
+
+    # Build the groupby once and push all six stat columns through it
+    # together; rebuilding the group indexer per stat costs more than
+    # the arithmetic for career-sized frames
+    grouped = df.groupby('PLAYER_ID', sort=False, observed=True)[ROLLING_STATS]
+    df[[f'{stat}_PCT_CHANGE' for stat in ROLLING_STATS]] = grouped.pct_change()
+
+    # Recency-weighted 3-season rolling averages, written as shifted
+    # weighted sums so the whole block stays in compiled NumPy instead
+    # of a Python lambda per window; the weights renormalize at career
+    # starts where fewer than three seasons exist
+    current = df[ROLLING_STATS]
+    prev1 = grouped.shift(1)
+    prev2 = grouped.shift(2)
+    weight_sum = (current.notna() * _ROLLING_WEIGHTS[0]
+                  + prev1.notna() * _ROLLING_WEIGHTS[1]
+                  + prev2.notna() * _ROLLING_WEIGHTS[2])
+    weighted = (current.fillna(0) * _ROLLING_WEIGHTS[0]
+                + prev1.fillna(0) * _ROLLING_WEIGHTS[1]
+                + prev2.fillna(0) * _ROLLING_WEIGHTS[2])
+    for stat in ROLLING_STATS:
+        df[f'{stat}_ROLLING_AVG'] = weighted[stat] / weight_sum[stat]
+
+    # Year-over-year decline severity; abs(min(x, 0)) == max(-x, 0), so
+    # negating and clipping does it in one compiled op per column
+    df['PER_DECLINE_SEVERITY'] = (-df['PLAYER_EFFICIENCY_RATING_PCT_CHANGE']).clip(lower=0).fillna(0)
+    df['USAGE_DECLINE_SEVERITY'] = (-df['MIN_PER_GAME_PCT_CHANGE']).clip(lower=0).fillna(0)
+
+    # Season-over-season decline flags: ffill and diff run at frame
+    # level on the cached groupby, no per-group Python lambdas
+    ffilled = grouped.ffill()[['PLAYER_EFFICIENCY_RATING', 'MIN_PER_GAME']]
+    declines = ffilled.groupby(df['PLAYER_ID'].to_numpy(), sort=False).diff().lt(0)
+    df['PER_DECLINE'] = declines['PLAYER_EFFICIENCY_RATING']
+    df['USAGE_DECLINE'] = declines['MIN_PER_GAME']
+
+    return df
+
+@st.cache_data(ttl=3600, show_spinner=False, hash_funcs=_DF_HASH)
+def calculate_career_risk_score(processed_df):
+    if not isinstance(processed_df, pd.DataFrame):
+        raise ValueError("Input must be a pandas DataFrame")
+
+    # argmax is O(N) and skips the full sort + index rebuild the old
+    # sort_values(...).iloc[0] paid just to grab one row
+    latest_season = processed_df.iloc[processed_df['SEASON_YEAR'].to_numpy().argmax()]
+    # Plain min/max on these scalars skips NumPy's ufunc dispatch and the
+    # 0-d array allocations np.clip would hand back
+    age_risk = min(max(latest_season['YEARS_FROM_DRAFT'] / 20.0, 0.0), 1.0)
+    decline_risk = min(max(processed_df['PER_DECLINE_SEVERITY'].mean()
+                           + processed_df['USAGE_DECLINE_SEVERITY'].mean(), 0.0), 1.0)
+    availability_risk = 1.0 - processed_df['GP_RATIO'].mean()
+
+    risk_score = 0.4 * age_risk + 0.4 * decline_risk + 0.2 * availability_risk
+    return float(min(max(risk_score, 0.0), 1.0))
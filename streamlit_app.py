@@ -1,8 +1,15 @@
 import streamlit as st
 import pandas as pd
-from data.fetch_data import fetch_player_data, load_image
-from data.process_data import calculate_average_points
-from visualization.plot_data import plot_average_points
+
+# Copy-on-write lets the processing pipeline skip eager defensive copies
+pd.set_option("mode.copy_on_write", True)
+
+from data.async_fetch import fetch_player_page
+from data.fetch_data import fetch_all_players
+from data.process_data import (calculate_average_points, process_longevity_features,
+                               calculate_career_risk_score)
+from visualization.plot_data import (plot_average_points_interactive, plot_longevity_analysis,
+                                     plot_career_trajectory, plot_risk_score_gauge)
 
 # Add custom CSS to make the content wider
 st.markdown("""
@@ -19,32 +26,43 @@ st.markdown("""
 
 st.title('NBA Player Analysis')
 
-player_options = {
-    'LeBron James': '2544',
-    'Stephen Curry': '201939',
-    'Kevin Durant': '201142',
-    'Giannis Antetokounmpo': '203507',
-    'Klay Thompson': '202691',
-    'Anthony Davis': '203076',
-    'Russell Westbrook': '201566',
-    'James Harden': '201935',
-    'Chris Paul': '101108',
-    'DeMar DeRozan': '201942'
-}
-
-selected_player = st.selectbox('Select a player', list(player_options.keys()))
-
-if selected_player:
-    player_id = player_options[selected_player]
-    
+players_df = fetch_all_players()
+
+# Vectorized string concat dispatches to C-level str operations; a
+# per-row apply here would run a Python lambda for every player
+players_df['DISPLAY_NAME'] = (players_df['PLAYER_NAME'] + ' ('
+                              + players_df['TEAM_ABBREVIATION'].astype(str) + ' '
+                              + players_df['FROM_YEAR'].astype(str) + '-'
+                              + players_df['TO_YEAR'].astype(str) + ')')
+
+# Hash-map lookups so a rerun resolves the selection in O(1) instead of
+# boolean-masking the whole roster every time
+@st.cache_data(show_spinner=False)
+def _player_lookup(df):
+    return dict(zip(df['DISPLAY_NAME'], zip(df['PLAYER_ID'], df['PLAYER_NAME'])))
+
+@st.cache_data(show_spinner=False)
+def _default_index(df, player_id='2544'):
+    ids = df['PLAYER_ID'].astype(str)
+    return int(ids[ids == player_id].index[0])
+
+default_idx = _default_index(players_df)
+selected_display = st.selectbox('Select a player', players_df['DISPLAY_NAME'], index=default_idx)
+
+if selected_display:
+    player_id, selected_player = _player_lookup(players_df)[selected_display]
+
+    # Career data and the headshot are independent downloads, so fetch
+    # them concurrently instead of stacking the round-trips
+    image_url = f"https://cdn.nba.com/headshots/nba/latest/1040x760/{player_id}.png?imwidth=1040&imheight=760"
+    with st.spinner("Loading player data..."):
+        longevity_data, img = fetch_player_page(player_id, image_url)
+
     # Create two columns for layout
     col1, col2 = st.columns([1, 2])
-    
+
     # Display player image in the first column
     with col1:
-        image_url = f"https://cdn.nba.com/headshots/nba/latest/1040x760/{player_id}.png?imwidth=1040&imheight=760"
-        with st.spinner("Loading player image..."):
-            img = load_image(image_url)
         if img is not None:
             st.image(img, caption=selected_player, width=200)
         else:
@@ -52,7 +70,10 @@ if selected_player:
     
     # Display stats and charts in the second column
     with col2:
-        player_career_df = fetch_player_data(player_id)
+        # One fetch covers both the basic stats and the longevity view;
+        # the career frame already contains everything
+        # calculate_average_points needs
+        player_career_df = longevity_data.career
         average_points = calculate_average_points(player_career_df)
         
         st.subheader('Career Stats')
@@ -65,5 +86,26 @@ if selected_player:
     st.bar_chart(average_points, use_container_width=True)
 
     st.subheader('Alternative Visualization')
-    fig = plot_average_points(average_points, selected_player)
-    st.pyplot(fig, use_container_width=True)
+    fig = plot_average_points_interactive(average_points, selected_player)
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Longevity analysis, derived from the same fetch as the stats above
+    st.subheader('Career Longevity Analysis')
+    processed_df = process_longevity_features(player_career_df)
+    risk_score = calculate_career_risk_score(processed_df)
+
+    figures = plot_longevity_analysis(processed_df, player_id)
+    st.plotly_chart(figures['trajectory'], use_container_width=True)
+
+    gauge_col, radar_col = st.columns(2)
+    with gauge_col:
+        st.plotly_chart(plot_risk_score_gauge(risk_score), use_container_width=True)
+    with radar_col:
+        st.plotly_chart(figures['radar'], use_container_width=True)
+
+    st.plotly_chart(figures['efficiency'], use_container_width=True)
+    st.plotly_chart(figures['usage'], use_container_width=True)
+
+    trajectory_metric = st.selectbox('Trajectory stat', ['PTS', 'AST', 'REB', 'MIN_PER_GAME'])
+    st.plotly_chart(plot_career_trajectory(processed_df, trajectory_metric),
+                    use_container_width=True)
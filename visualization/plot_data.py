@@ -1,13 +1,230 @@
 # This module contains functions for plotting NBA player data
-# It uses matplotlib and seaborn for data visualization
-import matplotlib.pyplot as plt
-import seaborn as sns
+# It uses matplotlib and plotly for data visualization
+# matplotlib is imported lazily inside plot_average_points so the
+# plotly-only paths don't pay its import cost at cold start
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
 
 def plot_average_points(average_points, player_name):
-    fig, ax = plt.subplots(figsize=(10, 6))
-    sns.lineplot(x=average_points.index, y=average_points.values, ax=ax, marker='o')
-    plt.title(f'Average Points per Season - {player_name}')
-    plt.xlabel('Season')
-    plt.ylabel('Average Points')
-    plt.xticks(rotation=45)
+    from matplotlib.figure import Figure
+
+    # Build the figure outside pyplot so it never lands in the Gcf
+    # registry; it becomes garbage-collectable the moment the caller
+    # drops its reference, instead of lingering for the process lifetime.
+    # Plain ax.plot suffices — the series is already reduced, so
+    # seaborn's aggregation machinery had nothing to do here
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    ax.plot(average_points.index.to_numpy(), average_points.to_numpy(), marker='o')
+    ax.set_title(f'Average Points per Season - {player_name}')
+    ax.set_xlabel('Season')
+    ax.set_ylabel('Average Points')
+    ax.tick_params(axis='x', rotation=45)
+    return fig
+
+def plot_average_points_png(average_points, player_name):
+    # Rasterize once and return PNG bytes: display-only callers skip
+    # matplotlib's draw pipeline on later reruns, the figure's lifetime
+    # is bounded to this call, and bytes are hashable so the result can
+    # be cached upstream. plot_average_points stays for callers that
+    # want a live Figure
+    from io import BytesIO
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = plot_average_points(average_points, player_name)
+    buf = BytesIO()
+    FigureCanvasAgg(fig).print_png(buf)
+    return buf.getvalue()
+
+# Plotly variant for Streamlit: figure construction is plain dict work
+# and the browser does the rendering, so reruns skip the whole
+# matplotlib draw pipeline; cached per (seasons, values) so an unchanged
+# player costs a dict lookup
+@st.cache_data(show_spinner=False,
+               hash_funcs={pd.Series: lambda s: (tuple(s.index), tuple(s.values))})
+def plot_average_points_interactive(average_points, player_name):
+    return go.Figure(
+        data=[go.Scatter(x=average_points.index, y=average_points.values, mode='lines+markers')],
+        layout=dict(title=f'Average Points per Season - {player_name}',
+                    xaxis_title='Season', yaxis_title='Average Points'))
+
+# Reuse figures across re-renders keyed by player: rebuilding the four
+# longevity figures re-runs Plotly's full trace validation, while
+# mutating the cached figures inside batch_update only patches the data.
+# Plain go.Figure, not FigureWidget — st.plotly_chart re-serializes the
+# whole figure anyway and FigureWidget drags in anywidget/ipywidgets.
+# Maps player_id -> (fingerprint, figures dict); capped so a long-running
+# server browsing the whole roster can't accumulate figures forever
+_FIG_CACHE = {}
+_FIG_CACHE_MAX = 64
+
+# Shared layout defaults, validated once at import; applying the
+# template per figure skips re-running the property validators on the
+# same hovermode/font/margin values for every chart
+_LONGEVITY_TEMPLATE = go.layout.Template(
+    layout=go.Layout(hovermode='x unified', font={'size': 12},
+                     margin=dict(l=40, r=20, t=40, b=40)))
+
+# Trajectory traces as (column, display label, color); the labels are
+# constants, so no per-call str.replace on the column names
+_TRAJECTORY_SPEC = (('PTS_ROLLING_AVG', 'PTS', 'blue'),
+                    ('AST_ROLLING_AVG', 'AST', 'red'),
+                    ('REB_ROLLING_AVG', 'REB', 'green'))
+
+def plot_longevity_analysis(processed_df, player_id=None):
+    # Cheap fingerprint: when the player's data hasn't changed since the
+    # last call, hand back the cached figures without touching a column
+    fingerprint = (len(processed_df), int(processed_df['CAREER_YEAR'].iat[-1]),
+                   float(processed_df['PLAYER_EFFICIENCY_RATING'].iat[-1]))
+    cached = _FIG_CACHE.get(player_id) if player_id is not None else None
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    # Hoist every referenced column to a local ndarray up front: each
+    # DataFrame __getitem__ pays index lookup + block dispatch, and
+    # Plotly's serializer takes its fast buffer path for ndarrays while
+    # Series get re-coerced per trace
+    career_year = processed_df['CAREER_YEAR'].to_numpy()
+    metric_arrays = {col: processed_df[col].to_numpy() for col, _, _ in _TRAJECTORY_SPEC}
+    per_arr = processed_df['PLAYER_EFFICIENCY_RATING'].to_numpy()
+    mpg_arr = processed_df['MIN_PER_GAME'].to_numpy()
+    per_mean = per_arr.mean()
+    mpg_mean = mpg_arr.mean()
+
+    # One contiguous scan covers all three column means; iat and plain
+    # min/max skip the axis-indexer machinery and NumPy scalar dispatch
+    means = processed_df[['PER_DECLINE_SEVERITY', 'USAGE_DECLINE_SEVERITY',
+                          'GP_RATIO']].to_numpy().mean(axis=0)
+    risk_factors = {
+        'Age Risk': min(max(processed_df['YEARS_FROM_DRAFT'].iat[-1] / 20.0, 0.0), 1.0),
+        'Performance Decline': float(means[0]),
+        'Usage Decline': float(means[1]),
+        'Injury Risk': float(1.0 - means[2]),
+    }
+
+    if cached is not None:
+        figures = cached[1]
+        _update_longevity_figures(figures, career_year, metric_arrays, per_arr, mpg_arr,
+                                  per_mean, mpg_mean, risk_factors)
+        _FIG_CACHE[player_id] = (fingerprint, figures)
+        return figures
+
+    # Building every trace up front and passing them to one
+    # go.Figure(data=...) call runs the trace validator once instead of
+    # per add_trace
+    traces = [go.Scattergl(x=career_year, y=metric_arrays[col], name=label,
+                           line={'color': color})
+              for col, label, color in _TRAJECTORY_SPEC]
+    trajectory_fig = go.Figure(data=traces)
+    trajectory_fig.update_layout(template=_LONGEVITY_TEMPLATE,
+                                 title='Weighted Rolling Averages by Career Year',
+                                 xaxis_title='CAREER_YEAR')
+
+    radar_fig = go.Figure(go.Scatterpolar(
+        r=np.fromiter(risk_factors.values(), dtype=float),
+        theta=list(risk_factors.keys()), fill='toself'))
+    radar_fig.update_layout(template=_LONGEVITY_TEMPLATE, title='Risk Factor Breakdown',
+                            polar=dict(radialaxis=dict(range=[0, 1])), showlegend=False)
+
+    # These are plain column-vs-column lines, so build the graph objects
+    # directly — px.line's grouping/reshaping/validation layer is pure
+    # overhead here (Scattergl keeps the WebGL rendering path)
+    efficiency_fig = go.Figure(go.Scattergl(x=career_year, y=per_arr, mode='lines'))
+    efficiency_fig.update_layout(template=_LONGEVITY_TEMPLATE,
+                                 title='Player Efficiency Rating Trend',
+                                 xaxis_title='CAREER_YEAR',
+                                 yaxis_title='PLAYER_EFFICIENCY_RATING')
+    efficiency_fig.add_hline(y=per_mean, line_dash='dash', annotation_text='career avg')
+
+    usage_fig = go.Figure(go.Scattergl(x=career_year, y=mpg_arr, mode='lines'))
+    usage_fig.update_layout(template=_LONGEVITY_TEMPLATE, title='Minutes per Game Trend',
+                            xaxis_title='CAREER_YEAR', yaxis_title='MIN_PER_GAME')
+    usage_fig.add_hline(y=mpg_mean, line_dash='dash', annotation_text='career avg')
+
+    figures = {'trajectory': trajectory_fig,
+               'radar': radar_fig,
+               'efficiency': efficiency_fig,
+               'usage': usage_fig}
+    if player_id is not None:
+        _FIG_CACHE[player_id] = (fingerprint, figures)
+        # dicts iterate in insertion order, so the first key is the oldest
+        while len(_FIG_CACHE) > _FIG_CACHE_MAX:
+            _FIG_CACHE.pop(next(iter(_FIG_CACHE)))
+    return figures
+
+def _update_longevity_figures(figures, career_year, metric_arrays, per_arr, mpg_arr,
+                              per_mean, mpg_mean, risk_factors):
+    # Patch the existing figures instead of rebuilding; batch_update
+    # coalesces the assignments into one pass per figure
+    trajectory_fig = figures['trajectory']
+    with trajectory_fig.batch_update():
+        for trace, metric in zip(trajectory_fig.data, metric_arrays):
+            trace.x = career_year
+            trace.y = metric_arrays[metric]
+
+    radar_fig = figures['radar']
+    with radar_fig.batch_update():
+        radar_fig.data[0].r = np.fromiter(risk_factors.values(), dtype=float)
+
+    for key, y, mean in (('efficiency', per_arr, per_mean), ('usage', mpg_arr, mpg_mean)):
+        fig = figures[key]
+        with fig.batch_update():
+            fig.data[0].x = career_year
+            fig.data[0].y = y
+            # add_hline stored the career average as a shape + annotation;
+            # move both so the reference line tracks the new data
+            fig.layout.shapes[0].y0 = mean
+            fig.layout.shapes[0].y1 = mean
+            fig.layout.annotations[0].y = mean
+
+def plot_career_trajectory(processed_df, metric='PTS'):
+    fig = go.Figure(go.Scattergl(x=processed_df['CAREER_YEAR'].to_numpy(),
+                                 y=processed_df[metric].to_numpy(), mode='lines+markers'))
+    fig.update_layout(template=_LONGEVITY_TEMPLATE, title=f'Career Trajectory - {metric}',
+                      xaxis_title='CAREER_YEAR', yaxis_title=metric)
+    return fig
+
+# The gauge spec is invariant apart from the two value slots; keep the
+# skeleton at module scope instead of rebuilding the dicts per call
+_GAUGE_TEMPLATE = {
+    'mode': "gauge+number",
+    'value': None,
+    'title': {'text': 'Career Risk'},
+    'gauge': {
+        'axis': {'range': [0, 100]},
+        'bar': {'color': 'darkblue'},
+        'steps': [
+            {'range': [0, 33], 'color': 'lightgreen'},
+            {'range': [33, 66], 'color': 'gold'},
+            {'range': [66, 100], 'color': 'salmon'},
+        ],
+        'threshold': {'line': {'color': 'red', 'width': 4},
+                      'thickness': 0.75,
+                      'value': None},
+    },
+}
+
+def create_risk_gauge():
+    # Persistent figure for callers that redraw the score repeatedly:
+    # build once, then update_risk_gauge patches just the value slots.
+    # Merge level by level rather than writing into the template's
+    # nested dicts — those are shared module state across sessions
+    spec = _GAUGE_TEMPLATE | {'value': 0}
+    spec['gauge'] = _GAUGE_TEMPLATE['gauge'] | {
+        'threshold': _GAUGE_TEMPLATE['gauge']['threshold'] | {'value': 0}}
+    fig = go.Figure(go.Indicator(**spec))
+    fig.update_layout(height=300, margin=dict(l=10, r=10, t=50, b=10), font={'size': 16})
+    return fig
+
+def update_risk_gauge(fig, risk_score):
+    value = float(risk_score) * 100
+    with fig.batch_update():
+        fig.data[0].value = value
+        fig.data[0].gauge.threshold.value = value
+
+def plot_risk_score_gauge(risk_score):
+    fig = create_risk_gauge()
+    update_risk_gauge(fig, risk_score)
     return fig